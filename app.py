@@ -6,23 +6,45 @@ powered by Deepgram's Speech-to-Text service. It's designed to be easily
 modified and extended for your own projects.
 
 Key Features:
-- Single API endpoint: POST /api/transcription
+- Transcription endpoint: POST /api/transcription
 - Accepts both file uploads and URLs
+- Batch URL transcription: POST /api/transcription/batch
 - JWT session auth with rate limiting (production only)
 - Serves built frontend from frontend/dist/
 - CORS enabled for development
 """
 
+import asyncio
+import atexit
+import contextvars
 import functools
+import ipaddress
+import logging
+import logging.handlers
 import os
+import queue
 import secrets
+import socket
+import threading
 import time
+import tomllib
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 
+import httpcore
+import httpx
 import jwt
-from flask import Flask, request, jsonify, send_from_directory
+import msgspec
+from flask import Flask, Request, current_app, request, jsonify, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from deepgram import DeepgramClient
+from deepgram.core.api_error import ApiError
 from dotenv import load_dotenv
+from werkzeug.exceptions import RequestEntityTooLarge
+
+import transcript_cache
+import stt_response
 
 # Load .env without overriding existing env vars
 load_dotenv(override=False)
@@ -36,12 +58,110 @@ load_dotenv(override=False)
 # See: https://developers.deepgram.com/docs/models-languages-overview
 DEFAULT_MODEL = "nova-3"
 
+# Extra Deepgram options sent with every transcription request
+# (also part of the transcript cache key, see transcript_cache.py)
+TRANSCRIPTION_OPTIONS = {
+    "smart_format": True,
+}
+
+# Size of each chunk read from an upload while forwarding it to Deepgram.
+# Uploads are streamed chunk by chunk, so memory stays flat regardless of
+# file size.
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MB
+
+# How long to wait for the HEAD request that checks whether a cached URL
+# transcript is still current. Kept short so a slow host only delays the
+# request slightly before we fall back to keying on the URL alone.
+URL_HEAD_TIMEOUT = 2.0  # seconds
+
+# How long browsers may cache a CORS preflight (OPTIONS) result, so a
+# cross-origin frontend doesn't preflight before every POST. Chromium caps
+# this at 2 hours.
+CORS_PREFLIGHT_MAX_AGE = 7200  # seconds
+
 # Server configuration
 CONFIG = {
     "port": int(os.environ.get("PORT", 8081)),
     "host": os.environ.get("HOST", "0.0.0.0"),
+    # Comma-separated list of origins allowed to call the API ("*" for any).
+    # Unset means no CORS handling in production, where Caddy serves the
+    # frontend and API from the same origin; the dev server allows any origin.
+    "cors_origins": [o for o in os.environ.get("CORS_ORIGINS", "").split(",") if o],
+    # Maximum Deepgram requests in flight per batch request - keep this
+    # within your Deepgram account's concurrency limit
+    "batch_concurrency": int(os.environ.get("DG_CONCURRENCY", 5)),
+    # Maximum URLs accepted in one batch request - each item is a billed
+    # Deepgram call, so this bounds what a single request can start
+    "max_batch_items": int(os.environ.get("MAX_BATCH_ITEMS", 50)),
+    # Largest request body accepted, in MB - bigger uploads are rejected
+    # with a 413 before they are spooled to disk
+    "max_upload_mb": int(os.environ.get("MAX_UPLOAD_MB", 500)),
 }
 
+# ============================================================================
+# PER-PROCESS OBJECTS - Built once in each gunicorn worker, after the fork
+# ============================================================================
+
+def per_process(factory):
+    """
+    Decorator that runs a factory once per process and returns its result
+
+    Request threads can ask for the object at the same moment, so creation
+    is guarded by a lock (checked again once it is held) and only one
+    instance is ever built per process. The lock is per factory, so one
+    factory may use another (e.g. by logging) while it runs.
+    """
+    instances = {}
+    lock = threading.Lock()
+
+    @functools.wraps(factory)
+    def get():
+        pid = os.getpid()
+        instance = instances.get(pid)
+        if instance is None:
+            with lock:
+                instance = instances.get(pid)
+                if instance is None:
+                    instance = instances[pid] = factory()
+        return instance
+
+    return get
+
+# ============================================================================
+# LOGGING - Records are queued and written to stderr by a background thread
+# ============================================================================
+
+logger = logging.getLogger(__name__)
+
+_log_queue = queue.SimpleQueue()
+
+@per_process
+def _log_listener():
+    # Started lazily in each process, since threads don't survive the fork
+    # into gunicorn workers
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+    listener = logging.handlers.QueueListener(_log_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+class BackgroundLogHandler(logging.handlers.QueueHandler):
+    """
+    Log handler that only enqueues records
+
+    Writing to stderr happens on a listener thread, so request threads never
+    wait on the stream lock, e.g. when many transcriptions fail at once.
+    """
+
+    def enqueue(self, record):
+        _log_listener()
+        super().enqueue(record)
+
+logging.getLogger().addHandler(BackgroundLogHandler(_log_queue))
+
 # ============================================================================
 # SESSION AUTH - JWT tokens with rate limiting for production security
 # ============================================================================
@@ -51,7 +171,7 @@ JWT_EXPIRY = 3600  # 1 hour
 
 
 def require_session(f):
-    """Decorator that validates JWT from Authorization header."""
+    """Decorator that validates JWT from Authorization header (sync or async views)."""
     @functools.wraps(f)
     def decorated(*args, **kwargs):
         auth_header = request.headers.get("Authorization", "")
@@ -82,7 +202,7 @@ def require_session(f):
                     "message": "Invalid session token",
                 }
             }), 401
-        return f(*args, **kwargs)
+        return current_app.ensure_sync(f)(*args, **kwargs)
     return decorated
 
 
@@ -115,14 +235,118 @@ api_key = load_api_key()
 # SETUP - Initialize Flask, Deepgram, and middleware
 # ============================================================================
 
-# Initialize Deepgram client with API key
-deepgram = DeepgramClient(api_key=api_key)
+# HTTP clients are created lazily, once per process (see per_process).
+# Gunicorn imports the app in the master before forking (preload_app), and
+# connection pools must not be shared across fork - each worker builds its
+# own on first use.
+
+@per_process
+def get_deepgram():
+    """Returns this process's Deepgram client, creating it on first use."""
+    # A large keep-alive pool avoids repeated TCP/TLS handshakes, and HTTP/2
+    # multiplexes concurrent requests over a single connection
+    http_client = httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=200),
+        timeout=60.0,
+    )
+    return DeepgramClient(api_key=api_key, httpx_client=http_client)
+
+@per_process
+def get_source_http():
+    """Returns this process's client for HEAD requests to audio URLs."""
+    # Every connection, redirect hops included, goes through the public
+    # address check. Proxies from the environment are ignored, since the
+    # check needs to see the real destination.
+    return httpx.Client(
+        transport=PublicOnlyTransport(),
+        timeout=URL_HEAD_TIMEOUT,
+        follow_redirects=True,
+        max_redirects=3,
+        trust_env=False,
+    )
+
+class MsgspecJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by msgspec, a C extension that serializes several
+    times faster than the stdlib json module and encodes the typed
+    stt_response Structs without converting them to dicts first
+    """
+
+    def __init__(self, app):
+        super().__init__(app)
+        self._encoder = msgspec.json.Encoder(enc_hook=self.default)
+
+    def dumps(self, obj, **kwargs):
+        return self._encoder.encode(obj).decode()
+
+    def loads(self, s, **kwargs):
+        # Flask and Werkzeug only catch ValueError for malformed JSON
+        try:
+            return msgspec.json.decode(s)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def response(self, *args, **kwargs):
+        # msgspec already produces bytes, so skip the str -> bytes round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            self._encoder.encode(obj), mimetype=self.mimetype
+        )
+
+class HashingRequest(Request):
+    """
+    Request that hashes file uploads while Werkzeug spools them to disk
+
+    The transcript cache key for an upload is then ready as soon as the form
+    is parsed, without reading the spooled file a second time.
+    """
+
+    def _get_file_stream(self, *args, **kwargs):
+        stream = super()._get_file_stream(*args, **kwargs)
+        if not transcript_cache.is_enabled():
+            return stream
+        return transcript_cache.HashingStream(stream)
 
 # Initialize Flask app (API server only)
 app = Flask(__name__)
+app.request_class = HashingRequest
+app.config["MAX_CONTENT_LENGTH"] = CONFIG["max_upload_mb"] * 1024 * 1024
+app.json = MsgspecJSONProvider(app)
 
-# Enable CORS for frontend communication
-CORS(app)
+# Enable CORS only when cross-origin callers are configured - it adds an
+# after_request hook to every response. Preflights are answered by Flask's
+# automatic OPTIONS handling, which never enters the views or auth checks.
+if CONFIG["cors_origins"]:
+    CORS(app, origins=CONFIG["cors_origins"], max_age=CORS_PREFLIGHT_MAX_AGE)
+
+# ============================================================================
+# METADATA - Loaded once from deepgram.toml, which only changes on deploy
+# ============================================================================
+
+def load_metadata():
+    """
+    Loads the [meta] section of deepgram.toml
+
+    Returns:
+        tuple: (metadata dict, None) on success, or (None, error message)
+    """
+    toml_path = os.path.join(os.path.dirname(__file__), "deepgram.toml")
+    try:
+        with open(toml_path, "rb") as f:
+            config = tomllib.load(f)
+    except FileNotFoundError:
+        return None, "deepgram.toml file not found"
+    except Exception as e:
+        logger.exception("Error reading metadata")
+        return None, f"Failed to read metadata from deepgram.toml: {str(e)}"
+
+    if "meta" not in config:
+        return None, "Missing [meta] section in deepgram.toml"
+
+    return config["meta"], None
+
+METADATA, METADATA_ERROR = load_metadata()
 
 # ============================================================================
 # HELPER FUNCTIONS - Modular logic for easier understanding and testing
@@ -150,6 +374,22 @@ def validate_transcription_input(file, url):
     # Neither provided
     return None
 
+class UploadChunks:
+    """
+    Re-iterable view over an uploaded file that yields fixed-size chunks
+
+    Each iteration starts from the beginning of the file, so the SDK can
+    safely resend the body when it retries a failed request.
+    """
+
+    def __init__(self, file_obj, chunk_size=UPLOAD_CHUNK_SIZE):
+        self.file_obj = file_obj
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        self.file_obj.seek(0)
+        return iter(functools.partial(self.file_obj.read, self.chunk_size), b"")
+
 def transcribe_audio(input_data, model=DEFAULT_MODEL):
     """
     Sends a transcription request to Deepgram
@@ -163,21 +403,20 @@ def transcribe_audio(input_data, model=DEFAULT_MODEL):
     """
     # URL transcription
     if input_data["type"] == "url":
-        response = deepgram.listen.v1.media.transcribe_url(
+        response = get_deepgram().listen.v1.media.transcribe_url(
             url=input_data["data"],
             model=model,
-            smart_format=True,
+            **TRANSCRIPTION_OPTIONS,
         )
         return response
 
-    # File transcription
+    # File transcription - stream the upload instead of reading it into memory
     file_obj = input_data["data"]
-    file_content = file_obj.read()
 
-    response = deepgram.listen.v1.media.transcribe_file(
-        request=file_content,
+    response = get_deepgram().listen.v1.media.transcribe_file(
+        request=UploadChunks(file_obj.stream),
         model=model,
-        smart_format=True,
+        **TRANSCRIPTION_OPTIONS,
     )
     return response
 
@@ -190,7 +429,7 @@ def format_transcription_response(transcription_response, model_name):
         model_name: Name of model used for transcription
 
     Returns:
-        dict: Formatted response matching the STT contract
+        stt_response.TranscriptionResponse: Response matching the STT contract
     """
     # Access the results from the Deepgram response
     result = transcription_response.results.channels[0].alternatives[0]
@@ -199,56 +438,377 @@ def format_transcription_response(transcription_response, model_name):
     if not result:
         raise ValueError("No transcription results returned from Deepgram")
 
-    # Build response object matching the contract
-    response = {
-        "transcript": result.transcript or "",
-    }
-
     # Add optional fields if available
-    if hasattr(result, 'words') and result.words:
-        response["words"] = [
-            {
-                "text": word.word,
-                "start": word.start,
-                "end": word.end,
-                "speaker": word.speaker if hasattr(word, 'speaker') else None
-            }
-            for word in result.words
-        ]
-
-    if metadata and hasattr(metadata, 'duration'):
-        response["duration"] = metadata.duration
-
-    # Add metadata
-    response["metadata"] = {
-        "model_uuid": metadata.model_uuid if hasattr(metadata, 'model_uuid') else None,
-        "request_id": metadata.request_id if hasattr(metadata, 'request_id') else None,
-        "model_name": model_name,
-    }
+    words = getattr(result, 'words', None)
+
+    # getattr() with a default reads each attribute once, where hasattr()
+    # followed by attribute access looked it up twice
+    return stt_response.TranscriptionResponse(
+        transcript=result.transcript or "",
+        words=stt_response.build_words(words) if words else [],
+        duration=getattr(metadata, 'duration', None),
+        metadata=stt_response.Metadata(
+            model_uuid=getattr(metadata, 'model_uuid', None),
+            request_id=getattr(metadata, 'request_id', None),
+            model_name=model_name,
+        ),
+    )
 
-    return response
+class BlockedDestinationError(Exception):
+    """Raised when a URL points somewhere the server must not contact."""
 
-def format_error_response(error, status_code=500):
+# Monotonic deadline for the HEAD request running in this context. Every
+# network step of the request (lookup, connect, TLS, reads) and each
+# redirect hop draws on this one budget - see url_cache_source.
+_source_deadline = contextvars.ContextVar("source_deadline", default=None)
+
+def source_time_left(timeout, timeout_error):
     """
-    Formats error responses in a consistent structure per the contract
+    Shortens a per-operation timeout to what is left of the HEAD budget
+
+    Raises:
+        timeout_error: If the budget has already run out
+    """
+    deadline = _source_deadline.get()
+    if deadline is None:
+        return timeout
+    left = deadline - time.monotonic()
+    if left <= 0:
+        raise timeout_error("URL check time budget exhausted")
+    return left if timeout is None else min(timeout, left)
+
+@per_process
+def get_resolver_pool():
+    """Returns this process's thread pool for DNS lookups of audio hosts."""
+    # getaddrinfo can't be interrupted, so lookups run here and are abandoned
+    # once the budget runs out. The pool bounds how many can pile up.
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="resolve")
+
+def resolve_public_addresses(host, port, timeout):
+    """
+    Resolves a host and checks that every address it has is public
+
+    Audio URLs come from clients, so without this the HEAD request in
+    url_cache_source could probe loopback, cloud metadata (169.254.169.254)
+    or other internal services. Every address the host resolves to must be
+    globally routable.
+
+    Args:
+        host: Hostname or IP address from the URL
+        port: Port to connect to
+        timeout: Seconds to wait for the lookup
+
+    Returns:
+        list[str]: The vetted IP addresses, in resolver order
+
+    Raises:
+        BlockedDestinationError: For hosts that don't resolve in time, or
+            that resolve to loopback, private, link-local or reserved addresses
+    """
+    lookup = get_resolver_pool().submit(
+        socket.getaddrinfo, host, port, type=socket.SOCK_STREAM
+    )
+    try:
+        infos = lookup.result(timeout=timeout)
+    except FutureTimeoutError as e:
+        lookup.cancel()
+        raise BlockedDestinationError(f"Timed out resolving {host}") from e
+    except (OSError, UnicodeError) as e:
+        raise BlockedDestinationError(f"Cannot resolve {host}") from e
+
+    addresses = []
+    for info in infos:
+        try:
+            address = ipaddress.ip_address(info[4][0])
+        except ValueError as e:
+            raise BlockedDestinationError(f"Unparseable address for {host}") from e
+        if not address.is_global or address.is_multicast:
+            raise BlockedDestinationError(f"Non-public address for {host}")
+        addresses.append(str(address))
+    return addresses
+
+class DeadlineStream(httpcore.NetworkStream):
+    """Network stream whose reads and writes stop at the HEAD deadline."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def read(self, max_bytes, timeout=None):
+        timeout = source_time_left(timeout, httpcore.ReadTimeout)
+        return self._stream.read(max_bytes, timeout)
+
+    def write(self, buffer, timeout=None):
+        timeout = source_time_left(timeout, httpcore.WriteTimeout)
+        self._stream.write(buffer, timeout)
+
+    def close(self):
+        self._stream.close()
+
+    def start_tls(self, ssl_context, server_hostname=None, timeout=None):
+        timeout = source_time_left(timeout, httpcore.ConnectTimeout)
+        return DeadlineStream(
+            self._stream.start_tls(ssl_context, server_hostname, timeout)
+        )
+
+    def get_extra_info(self, info):
+        return self._stream.get_extra_info(info)
+
+class PublicOnlyBackend(httpcore.SyncBackend):
+    """
+    Network backend that only connects to vetted public addresses
+
+    The host is resolved once, checked by resolve_public_addresses, and the
+    socket is opened to one of those exact addresses. Resolving again at
+    connect time would let a DNS server answer the check with a public
+    address and the connection with an internal one (DNS rebinding). The
+    URL keeps its hostname, so the Host header, TLS SNI and certificate
+    check are unchanged.
+    """
+
+    def connect_tcp(self, host, port, timeout=None, local_address=None,
+                    socket_options=None):
+        lookup_timeout = source_time_left(timeout, httpcore.ConnectTimeout)
+        addresses = resolve_public_addresses(host, port, lookup_timeout)
+
+        error = BlockedDestinationError(f"No addresses for {host}")
+        for address in addresses:
+            try:
+                stream = super().connect_tcp(
+                    address,
+                    port,
+                    source_time_left(timeout, httpcore.ConnectTimeout),
+                    local_address,
+                    socket_options,
+                )
+            except httpcore.ConnectError as e:
+                error = e
+            else:
+                return DeadlineStream(stream)
+        raise error
+
+class PublicOnlyTransport(httpx.HTTPTransport):
+    """httpx transport whose connections go through PublicOnlyBackend."""
+
+    def __init__(self):
+        super().__init__()
+        # httpx has no option for a custom network backend, so the pool it
+        # builds is swapped for one with the same defaults that uses ours
+        limits = httpx.Limits()
+        self._pool = httpcore.ConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            network_backend=PublicOnlyBackend(),
+        )
+
+def url_cache_source(url):
+    """
+    Identifies the audio behind a URL for the transcript cache
+
+    Sends a HEAD request and adds the response's ETag (or Last-Modified) and
+    Content-Length to the URL, so a cached transcript is only reused while
+    the remote file is unchanged. If the HEAD request fails, the server
+    sends no validators, or the URL (or a redirect) points at a non-public
+    address (see PublicOnlyBackend), the URL alone is used.
+
+    The whole request, lookups and redirects included, gets URL_HEAD_TIMEOUT
+    seconds in total and is abandoned once that runs out.
+
+    Args:
+        url: Audio URL from the request
+
+    Returns:
+        str: Cache source string for transcript_cache.make_key
     """
-    # Map status codes to error responses
-    if status_code == 400:
-        error_type = "ValidationError"
-        error_code = "INVALID_INPUT"
-        safe_message = "The request is invalid. Please check your input and try again."
+    deadline = _source_deadline.set(time.monotonic() + URL_HEAD_TIMEOUT)
+    try:
+        response = get_source_http().head(url)
+    except (httpx.HTTPError, httpx.InvalidURL, BlockedDestinationError):
+        return f"url:{url}"
+    finally:
+        _source_deadline.reset(deadline)
+
+    headers = response.headers
+    validator = headers.get("etag") or headers.get("last-modified")
+    if not response.is_success or not validator:
+        return f"url:{url}"
+
+    return f"url:{url}|{validator}|{headers.get('content-length', '')}"
+
+def build_cache_key(input_data, model):
+    """
+    Builds the transcript cache key for a request
+
+    Uploads are keyed by the SHA-256 of their contents (computed while the
+    upload was received, see HashingRequest), URLs by the URL plus the
+    remote file's cache validators (see url_cache_source).
+
+    Args:
+        input_data: dict with 'type' and 'data' keys
+        model: Model name to use (e.g., "nova-3")
+
+    Returns:
+        str: Cache key for transcript_cache
+    """
+    if input_data["type"] == "url":
+        source = url_cache_source(input_data["data"])
     else:
-        error_type = "TranscriptionError"
-        error_code = "TRANSCRIPTION_FAILED"
-        safe_message = "Transcription failed. Please try again."
+        source = f"file:{transcript_cache.hash_file(input_data['data'].stream)}"
+
+    return transcript_cache.make_key(source, model, TRANSCRIPTION_OPTIONS)
+
+def transcribe_with_cache(input_data, model=DEFAULT_MODEL):
+    """
+    Returns a formatted transcription, reusing a cached result when available
+
+    Args:
+        input_data: dict with 'type' and 'data' keys
+        model: Model name to use (e.g., "nova-3")
+
+    Returns:
+        stt_response.TranscriptionResponse on a cache miss, or the cached
+        dict on a hit - both serialize to the STT contract response
+    """
+    if not transcript_cache.is_enabled():
+        return format_transcription_response(transcribe_audio(input_data, model), model)
 
-    return {
+    cache_key = build_cache_key(input_data, model)
+    cached = transcript_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    formatted_response = format_transcription_response(
+        transcribe_audio(input_data, model),
+        model
+    )
+    transcript_cache.put(
+        cache_key, formatted_response, model=model, source=input_data["type"]
+    )
+    return formatted_response
+
+# Error bodies per status code, built once at import - they never vary per
+# request, so format_error_response() hands out these shared dicts
+ERROR_RESPONSES = {
+    400: {
+        "error": {
+            "type": "ValidationError",
+            "code": "INVALID_INPUT",
+            "message": "The request is invalid. Please check your input and try again.",
+        }
+    },
+    413: {
         "error": {
-            "type": error_type,
-            "code": error_code,
-            "message": safe_message,
+            "type": "ValidationError",
+            "code": "FILE_TOO_LARGE",
+            "message": "The uploaded file is too large.",
         }
-    }, status_code
+    },
+    429: {
+        "error": {
+            "type": "RateLimitError",
+            "code": "RATE_LIMITED",
+            "message": "Too many transcription requests. Please try again later.",
+        }
+    },
+    500: {
+        "error": {
+            "type": "TranscriptionError",
+            "code": "TRANSCRIPTION_FAILED",
+            "message": "Transcription failed. Please try again.",
+        }
+    },
+}
+
+def format_error_response(error, status_code=500):
+    """
+    Formats error responses in a consistent structure per the contract
+
+    The returned dict is shared between requests and must not be modified.
+    Unknown status codes get the generic transcription error body.
+    """
+    return ERROR_RESPONSES.get(status_code, ERROR_RESPONSES[500]), status_code
+
+def error_status_for(error):
+    """
+    Picks the HTTP status to report for an exception raised while transcribing
+
+    Validation problems are 400s, oversized uploads are 413s and Deepgram
+    rate limiting is passed through as a 429 so clients can back off;
+    everything else is a 500.
+    """
+    if isinstance(error, ValueError):
+        return 400
+    if isinstance(error, RequestEntityTooLarge):
+        return 413
+    if isinstance(error, ApiError) and error.status_code == 429:
+        return 429
+    return 500
+
+def validate_batch_input(payload):
+    """
+    Validates a batch transcription request body
+
+    Args:
+        payload: Parsed JSON body, expected shape
+            {"items": [{"url": ...}, ...], "model": "..."}
+
+    Returns:
+        list: URL strings to transcribe, or None if invalid (not a list of
+        URL items, more than MAX_BATCH_ITEMS items, or a non-string model)
+    """
+    if not isinstance(payload, dict):
+        return None
+
+    items = payload.get("items")
+    if not isinstance(items, list) or not items:
+        return None
+    if len(items) > CONFIG["max_batch_items"]:
+        return None
+
+    model = payload.get("model")
+    if model is not None and not isinstance(model, str):
+        return None
+
+    urls = []
+    for item in items:
+        url = item.get("url") if isinstance(item, dict) else None
+        if not isinstance(url, str) or not url:
+            return None
+        urls.append(url)
+
+    return urls
+
+async def transcribe_batch_item(url, model, executor):
+    """
+    Transcribes one URL from a batch on the batch's thread pool
+
+    The pool has DG_CONCURRENCY threads, so items queue there until a
+    thread is free. Failures are reported per item rather than failing the
+    whole batch.
+
+    Returns:
+        dict: {"status": 200, "result": {...}} or {"status": code, "error": {...}}
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        result = await loop.run_in_executor(
+            executor,
+            functools.partial(transcribe_with_cache, {"type": "url", "data": url}, model),
+        )
+        return {"status": 200, "result": result}
+    except Exception as e:
+        status = error_status_for(e)
+        if status == 500:
+            logger.exception("Batch transcription error for %s", url)
+        error_response, status = format_error_response(e, status)
+        return {"status": status, **error_response}
+
+@app.errorhandler(RequestEntityTooLarge)
+def handle_request_too_large(error):
+    """Rejects bodies over MAX_CONTENT_LENGTH with a contract-style 413."""
+    error_response, status = format_error_response(error, 413)
+    return jsonify(error_response), status
 
 # ============================================================================
 # SESSION ROUTES - Auth endpoints (unprotected)
@@ -301,10 +861,11 @@ def transcribe():
         }
     """
     try:
-        # Extract file and URL from request
-        file = request.files.get("file")
+        # Extract URL and file from request - a URL takes precedence, so the
+        # file field is only looked up when there is no URL
         url = request.form.get("url")
         model = request.form.get("model", DEFAULT_MODEL)
+        file = None if url else request.files.get("file")
 
         # Validate input - must have either file or URL
         input_data = validate_transcription_input(file, url)
@@ -316,14 +877,10 @@ def transcribe():
             )
             return jsonify(error_response), status
 
-        # Transcribe the audio
-        transcription_response = transcribe_audio(input_data, model)
-
-        # Format and return the response
-        formatted_response = format_transcription_response(
-            transcription_response,
-            model
-        )
+        # Transcribe (or fetch from cache) and format the response. This
+        # blocks the current gunicorn thread while Deepgram works, so
+        # concurrency comes from GUNICORN_THREADS (see gunicorn.conf.py)
+        formatted_response = transcribe_with_cache(input_data, model)
 
         return jsonify(formatted_response), 200
 
@@ -333,11 +890,63 @@ def transcribe():
         return jsonify(error_response), status
 
     except Exception as e:
-        # Transcription errors (500)
-        print(f"Transcription error: {e}")
-        error_response, status = format_error_response(e, 500)
+        # Deepgram rate limiting (429) or transcription errors (500)
+        status = error_status_for(e)
+        if status == 500:
+            logger.exception("Transcription error")
+        error_response, status = format_error_response(e, status)
         return jsonify(error_response), status
 
+@app.route("/api/transcription/batch", methods=["POST"])
+@require_session
+async def transcribe_batch():
+    """
+    POST /api/transcription/batch
+
+    Transcribes up to MAX_BATCH_ITEMS (default 50) audio URLs in one
+    request. The Deepgram calls run concurrently, at most DG_CONCURRENCY
+    (default 5) at a time.
+
+    Request body (JSON):
+        {
+            "items": [{"url": "https://..."}, ...],
+            "model": "nova-3"  # optional
+        }
+
+    Returns:
+        JSON response with one entry per item, in request order:
+        {
+            "results": [
+                {"status": 200, "result": {...}},  # STT contract response
+                {"status": 429, "error": {...}},   # per-item failure
+            ]
+        }
+    """
+    payload = request.get_json(silent=True)
+    urls = validate_batch_input(payload)
+
+    if not urls:
+        error_response, status = format_error_response(
+            ValueError(
+                "'items' must be a non-empty list of at most "
+                f"{CONFIG['max_batch_items']} {{\"url\": ...}} objects, "
+                "and 'model' must be a string"
+            ),
+            400
+        )
+        return jsonify(error_response), status
+
+    model = payload.get("model") or DEFAULT_MODEL
+
+    # A dedicated pool per batch enforces DG_CONCURRENCY exactly - the
+    # loop's default executor is capped at min(32, cpus + 4) threads
+    with ThreadPoolExecutor(max_workers=CONFIG["batch_concurrency"]) as executor:
+        results = await asyncio.gather(
+            *(transcribe_batch_item(url, model, executor) for url in urls)
+        )
+
+    return jsonify({"results": results}), 200
+
 @app.route("/api/metadata", methods=["GET"])
 def get_metadata():
     """
@@ -346,41 +955,28 @@ def get_metadata():
     Returns metadata about this starter application from deepgram.toml
     Required for standardization compliance
     """
-    try:
-        import toml
-        with open('deepgram.toml', 'r') as f:
-            config = toml.load(f)
-
-        if 'meta' not in config:
-            return jsonify({
-                'error': 'INTERNAL_SERVER_ERROR',
-                'message': 'Missing [meta] section in deepgram.toml'
-            }), 500
-
-        return jsonify(config['meta']), 200
-
-    except FileNotFoundError:
+    if METADATA_ERROR:
         return jsonify({
             'error': 'INTERNAL_SERVER_ERROR',
-            'message': 'deepgram.toml file not found'
+            'message': METADATA_ERROR
         }), 500
 
-    except Exception as e:
-        print(f"Error reading metadata: {e}")
-        return jsonify({
-            'error': 'INTERNAL_SERVER_ERROR',
-            'message': f'Failed to read metadata from deepgram.toml: {str(e)}'
-        }), 500
+    return jsonify(METADATA), 200
 
 # ============================================================================
 # SERVER START
 # ============================================================================
 
+# Local development only - production runs under gunicorn (gunicorn.conf.py)
 if __name__ == "__main__":
     port = CONFIG["port"]
     host = CONFIG["host"]
     debug = os.environ.get("FLASK_DEBUG", "0") == "1"
 
+    # The dev frontend runs on a different port, so allow any origin
+    if not CONFIG["cors_origins"]:
+        CORS(app, max_age=CORS_PREFLIGHT_MAX_AGE)
+
     print("\n" + "=" * 70)
     print(f"🚀 Flask Transcription Server (Backend API)")
     print("=" * 70)
@@ -388,6 +984,7 @@ if __name__ == "__main__":
     print(f"")
     print(f"📡 GET  /api/session")
     print(f"📡 POST /api/transcription (auth required)")
+    print(f"📡 POST /api/transcription/batch (auth required)")
     print(f"📡 GET  /api/metadata")
     print(f"Debug:    {'ON' if debug else 'OFF'}")
     print("=" * 70 + "\n")
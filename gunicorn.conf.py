@@ -0,0 +1,22 @@
+"""
+Gunicorn configuration for production deployments
+
+Transcription requests spend nearly all of their time waiting on Deepgram,
+so each worker process runs a pool of threads to keep many requests in
+flight at once. Gunicorn picks this file up automatically from the working
+directory (see deploy/Dockerfile).
+"""
+
+import multiprocessing
+import os
+
+bind = f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', 8081)}"
+
+# One process per CPU, each with a thread pool for I/O-bound requests
+worker_class = "gthread"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+threads = int(os.environ.get("GUNICORN_THREADS", 32))
+
+# Import the app once in the master before forking, so every worker shares
+# the same generated SESSION_SECRET when one isn't set explicitly
+preload_app = True
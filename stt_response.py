@@ -0,0 +1,69 @@
+"""
+STT Response - Typed schema of the starter contract transcription response
+
+The response is built as msgspec Structs rather than nested dicts. Structs
+are cheaper to allocate than dicts, and msgspec encodes a known shape with a
+specialized C encoder instead of inspecting every value, which matters for
+long transcripts with tens of thousands of words. The JSON output matches
+the contract:
+
+    {
+        "transcript": "...",
+        "words": [{"text", "start", "end", "speaker"}, ...],  # optional
+        "duration": 123.45,                                   # optional
+        "metadata": {"model_uuid", "request_id", "model_name"}
+    }
+"""
+
+from typing import Any, Optional
+
+import msgspec
+
+
+class Word(msgspec.Struct):
+    """One entry of the "words" list; speaker is null without diarization."""
+
+    text: str
+    start: float
+    end: float
+    speaker: Optional[int] = None
+
+
+class Metadata(msgspec.Struct):
+    """Model and request identifiers reported by Deepgram."""
+
+    model_uuid: Optional[str]
+    request_id: Optional[str]
+    model_name: str
+
+
+class TranscriptionResponse(msgspec.Struct, kw_only=True, omit_defaults=True):
+    """
+    Formatted transcription result
+
+    Empty "words" and missing "duration" are left out of the JSON, as the
+    contract marks both optional.
+    """
+
+    transcript: str
+    words: list[Word] = []
+    duration: Optional[float] = None
+    metadata: Metadata
+
+
+def build_words(words: list[Any]) -> list[Word]:
+    """
+    Converts Deepgram word objects into contract Word entries
+
+    Speaker labels are present on every word or none, so this probes the
+    first word once instead of calling hasattr() per word.
+
+    Args:
+        words: Non-empty list of word objects from a Deepgram alternative
+
+    Returns:
+        list: Word entries, in the same order
+    """
+    if hasattr(words[0], "speaker"):
+        return [Word(w.word, w.start, w.end, w.speaker) for w in words]
+    return [Word(w.word, w.start, w.end) for w in words]
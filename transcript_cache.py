@@ -0,0 +1,236 @@
+"""
+Transcript Cache - On-disk cache of formatted transcription responses
+
+Responses are stored as small JSON envelopes, one file per cache key, under
+~/.cache/flask-transcription/ (override with TRANSCRIPT_CACHE_DIR). Keys are
+content-addressed: a SHA-256 over the audio source plus the model and
+options used, so repeating an identical request skips Deepgram entirely.
+
+Entries hold full transcripts as plain JSON, so retention is bounded: an
+entry expires TRANSCRIPT_CACHE_MAX_AGE seconds after it was written (default
+24 hours), and at most TRANSCRIPT_CACHE_MAX_ENTRIES are kept (default 1000,
+oldest deleted first). The directory and files are only accessible to the
+user running the app.
+
+Set NO_TRANSCRIPT_CACHE=1 to disable the cache.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+import msgspec
+
+logger = logging.getLogger(__name__)
+
+# Bump when the envelope or response format changes to ignore old entries
+CACHE_VERSION = 1
+
+CACHE_DIR = os.environ.get("TRANSCRIPT_CACHE_DIR") or os.path.join(
+    os.path.expanduser("~"), ".cache", "flask-transcription"
+)
+
+# Entries older than this are treated as a miss and deleted
+MAX_AGE = int(os.environ.get("TRANSCRIPT_CACHE_MAX_AGE", 24 * 60 * 60))  # seconds
+
+# Most entries kept on disk - the oldest are deleted beyond this
+MAX_ENTRIES = int(os.environ.get("TRANSCRIPT_CACHE_MAX_ENTRIES", 1000))
+
+# Size of each chunk read while hashing an upload
+HASH_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MB
+
+
+def is_enabled():
+    """Returns False when the cache is disabled via NO_TRANSCRIPT_CACHE=1."""
+    return os.environ.get("NO_TRANSCRIPT_CACHE") != "1"
+
+
+def hash_file(file_obj, chunk_size=HASH_CHUNK_SIZE):
+    """
+    Computes the SHA-256 of a file-like object in fixed-size chunks
+
+    The file is rewound before and after hashing so it can still be sent on.
+    Streams that were hashed while being written (HashingStream) are not
+    read again.
+
+    Returns:
+        str: Hex digest of the file contents
+    """
+    if isinstance(file_obj, HashingStream):
+        return file_obj.hexdigest()
+
+    hasher = hashlib.sha256()
+    file_obj.seek(0)
+    for chunk in iter(lambda: file_obj.read(chunk_size), b""):
+        hasher.update(chunk)
+    file_obj.seek(0)
+    return hasher.hexdigest()
+
+
+class HashingStream:
+    """
+    File-like wrapper that hashes every byte written through it
+
+    Used as the spool file for uploads, so the SHA-256 is computed while the
+    request body is being received instead of in a second pass over the file.
+    All other file methods are passed through to the wrapped stream.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.hasher = hashlib.sha256()
+
+    def write(self, data):
+        self.hasher.update(data)
+        return self.stream.write(data)
+
+    def hexdigest(self):
+        """Returns the hex digest of everything written so far."""
+        return self.hasher.hexdigest()
+
+    def __iter__(self):
+        return iter(self.stream)
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+def make_key(source, model, options):
+    """
+    Builds a cache key from an audio source, model and request options
+
+    Args:
+        source: Stable identifier for the audio, e.g. "file:<sha256>"
+        model: Deepgram model name
+        options: dict of extra Deepgram options sent with the request
+
+    Returns:
+        str: Hex SHA-256 cache key
+    """
+    payload = json.dumps(
+        {"source": source, "model": model, "options": options}, sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _path_for(key):
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+def _remove(path):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning("Failed to remove cache entry %s: %s", path, e)
+
+
+def _is_expired(mtime):
+    return time.time() - mtime > MAX_AGE
+
+
+def get(key):
+    """
+    Looks up a cached response
+
+    Missing, expired, unreadable or corrupt entries are treated as a cache
+    miss. Expired entries are deleted.
+
+    Returns:
+        dict: Cached response, or None on a miss
+    """
+    if not is_enabled():
+        return None
+
+    path = _path_for(key)
+    try:
+        if _is_expired(os.stat(path).st_mtime):
+            _remove(path)
+            return None
+        with open(path, "rb") as f:
+            envelope = msgspec.json.decode(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, msgspec.DecodeError) as e:
+        logger.warning("Ignoring unreadable cache entry %s: %s", key, e)
+        return None
+
+    if not isinstance(envelope, dict) or envelope.get("version") != CACHE_VERSION:
+        return None
+
+    return envelope.get("response")
+
+
+def put(key, response, **metadata):
+    """
+    Stores a response in the cache
+
+    The entry is written to a temporary file and renamed into place, so
+    concurrent readers never see a partial write. Expired and surplus
+    entries are then pruned. Failures are non-fatal.
+
+    Args:
+        key: Cache key from make_key()
+        response: Response to store (anything msgspec can serialize)
+        **metadata: Diagnostic fields recorded alongside the response
+    """
+    if not is_enabled():
+        return
+
+    envelope = {
+        "version": CACHE_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        **metadata,
+        "response": response,
+    }
+
+    try:
+        os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(msgspec.json.encode(envelope))
+            os.replace(tmp_path, _path_for(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError, msgspec.EncodeError) as e:
+        logger.warning("Failed to write cache entry %s: %s", key, e)
+        return
+
+    prune()
+
+
+def prune():
+    """
+    Deletes expired entries, then the oldest ones beyond MAX_ENTRIES
+
+    Runs after every write, so the cache never holds more than MAX_ENTRIES
+    for long. Entries are aged by file modification time, which is when
+    they were written.
+    """
+    entries = []
+    try:
+        with os.scandir(CACHE_DIR) as scan:
+            for entry in scan:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+                if _is_expired(mtime):
+                    _remove(entry.path)
+                else:
+                    entries.append((mtime, entry.path))
+    except OSError as e:
+        logger.warning("Failed to prune transcript cache: %s", e)
+        return
+
+    entries.sort()
+    for _, path in entries[:max(0, len(entries) - MAX_ENTRIES)]:
+        _remove(path)